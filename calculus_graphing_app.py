@@ -1,4 +1,5 @@
 import os
+import time
 import numpy as np
 import sympy as sp
 import matplotlib.pyplot as plt
@@ -8,6 +9,7 @@ from ttkbootstrap.constants import *
 from sympy.parsing.sympy_parser import parse_expr
 from scipy.integrate import quad
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
+from matplotlib.lines import Line2D
 from tkinter import filedialog
 from tkinter import PhotoImage
 from tkinter import ttk
@@ -16,10 +18,13 @@ from tkinter import ttk
 current_figure = None
 current_canvas = None
 current_theme = "darkly"  # Default theme
+parameter_range = (-10.0, 10.0)  # Slider range for parameters such as a, b, c
+parameter_default = 1.0  # Initial slider value for each parameter
 
 def parse_function(func_str):
     """
     Parse a function string into a SymPy expression. Supports both regular and piecewise functions.
+    Any free symbols other than x are returned, sorted by name, as adjustable parameters.
     """
     try:
         x = sp.symbols('x')  # Define the symbolic variable
@@ -36,7 +41,8 @@ def parse_function(func_str):
         else:
             # Handle regular functions
             expr = sp.sympify(func_str, locals={'x': x})
-        return expr, x
+        params = sorted(expr.free_symbols - {x}, key=lambda sym: sym.name)
+        return expr, x, params
     except Exception as e:
         raise ValueError(f"Invalid function expression: {str(e)}")
 
@@ -75,6 +81,630 @@ def evaluate_piecewise(func_expr, x_sym):
     else:
         return sp.lambdify(x_sym, func_expr, 'numpy')
 
+def sample_function(func, x_vals, *param_values):
+    """
+    Evaluate a lambdified function on an array of x-values and return a real float array.
+    Extra arguments are passed through as parameter values for precompiled kernels.
+    Constant results are broadcast to the grid; complex or undefined values become NaN.
+    """
+    with np.errstate(all='ignore'):
+        y_vals = np.asarray(func(x_vals, *param_values))
+        if np.iscomplexobj(y_vals):
+            y_vals = np.where(np.abs(y_vals.imag) < 1e-12, y_vals.real, np.nan)
+        y_vals = np.asarray(y_vals, dtype=float)
+    return np.array(np.broadcast_to(y_vals, np.shape(x_vals)), dtype=float)
+
+def find_sign_changes(x_vals, y_vals):
+    """
+    Locate the roots of sampled data with vectorized sign-change detection.
+    Returns the (left, right) brackets of every strict sign change, the grid points where the
+    samples are exactly zero, and the direction of each crossing (positive rising, negative falling).
+    """
+    finite = np.isfinite(y_vals)
+    signs = np.where(finite, np.sign(y_vals), np.nan)
+
+    # Strict sign changes between neighbouring finite samples
+    crossing = (signs[:-1] * signs[1:]) < 0
+    idx = np.nonzero(crossing)[0]
+    left, right = x_vals[idx], x_vals[idx + 1]
+    bracket_dir = signs[idx + 1] - signs[idx]
+
+    # Samples that land exactly on a root, either between opposite signs or at the edge of the domain
+    prev_sign = np.concatenate(([np.nan], signs[:-1]))
+    next_sign = np.concatenate((signs[1:], [np.nan]))
+    at_edge = (np.isnan(prev_sign) & (np.abs(next_sign) == 1)) | (np.isnan(next_sign) & (np.abs(prev_sign) == 1))
+    exact = (signs == 0) & (((prev_sign * next_sign) < 0) | at_edge)
+    exact_idx = np.nonzero(exact)[0]
+    exact_dir = np.nan_to_num(next_sign[exact_idx] - prev_sign[exact_idx])
+
+    return left, right, bracket_dir, x_vals[exact_idx], exact_dir
+
+def refine_roots(func, left, right, tol=1e-12, max_iter=100):
+    """
+    Refine a batch of sign-change brackets simultaneously with vectorized bisection.
+    Every bracket is halved in the same NumPy call, so a whole set of candidates costs
+    one function evaluation per iteration.
+    """
+    a = np.asarray(left, dtype=float).copy()
+    b = np.asarray(right, dtype=float).copy()
+    if a.size == 0:
+        return a, b
+    fa = sample_function(func, a)
+    for _ in range(max_iter):
+        mid = 0.5 * (a + b)
+        fm = sample_function(func, mid)
+        # Keep the half whose endpoints still differ in sign
+        move_left = np.sign(fm) == np.sign(fa)
+        a = np.where(move_left, mid, a)
+        fa = np.where(move_left, fm, fa)
+        b = np.where(move_left, b, mid)
+        if np.all(b - a <= tol * (1 + np.abs(mid))):
+            break
+    return a, b
+
+def filter_poles(func, left, right, directions, scale, rel_tol=1e-8):
+    """
+    Drop refined brackets that are really poles or jump discontinuities.
+    At a genuine root both ends of the collapsed bracket are finite and close to zero;
+    a pole or jump keeps a large magnitude on at least one side no matter how narrow it becomes.
+    """
+    limit = rel_tol * (1 + scale)
+    left_vals = sample_function(func, left)
+    right_vals = sample_function(func, right)
+    keep = (
+        np.isfinite(left_vals) & np.isfinite(right_vals)
+        & (np.abs(left_vals) <= limit) & (np.abs(right_vals) <= limit)
+    )
+    return 0.5 * (left[keep] + right[keep]), directions[keep]
+
+def merge_close_points(points, directions, tol):
+    """
+    Sort candidate points and merge any that lie within tol of each other.
+    """
+    order = np.argsort(points)
+    points, directions = points[order], directions[order]
+    if points.size < 2:
+        return points, directions
+    keep = np.concatenate(([True], np.diff(points) > tol))
+    return points[keep], directions[keep]
+
+def solve_sampled(func, x_vals, y_vals):
+    """
+    Find the roots of func on the grid x_vals given its samples y_vals.
+    Returns the root locations together with the direction of each crossing.
+    """
+    left, right, bracket_dir, exact_x, exact_dir = find_sign_changes(x_vals, y_vals)
+    finite_vals = y_vals[np.isfinite(y_vals)]
+    scale = np.max(np.abs(finite_vals)) if finite_vals.size else 0.0
+
+    left, right = refine_roots(func, left, right)
+    roots, bracket_dir = filter_poles(func, left, right, bracket_dir, scale)
+
+    points = np.concatenate((roots, exact_x))
+    directions = np.concatenate((bracket_dir, exact_dir))
+    tol = 1e-9 * (1 + np.abs(x_vals[-1] - x_vals[0]))
+    return merge_close_points(points, directions, tol)
+
+def compile_critical_point_kernels(func_expr, x_sym, params=()):
+    """
+    Lambdify f, f' and f'' once with x followed by any parameters as arguments.
+    A kernel is None when that expression does not depend on x. Derivatives that cannot be
+    lambdified (e.g. Derivative(sign(x), x)) fall back to finite differences of f, and if f
+    itself cannot be lambdified all kernels are None so the analysis is simply skipped.
+    """
+    args = (x_sym, *params)
+    try:
+        f_kernel = sp.lambdify(args, func_expr, 'numpy') if func_expr.has(x_sym) else None
+    except Exception:
+        return None, None, None
+    if f_kernel is None:
+        return None, None, None
+
+    kernels = [f_kernel]
+    expr = func_expr
+    for order in (1, 2):
+        expr = sp.diff(expr, x_sym)
+        if not expr.has(x_sym):
+            kernels.append(None)
+            continue
+        try:
+            kernels.append(sp.lambdify(args, expr, 'numpy'))
+        except Exception:
+            kernels.append(
+                lambda t, *values, order=order:
+                    numerical_derivative(lambda s: f_kernel(s, *values), t, order)
+            )
+    return tuple(kernels)
+
+def find_critical_points(kernels, x_vals, param_values=()):
+    """
+    Find the zeros, local extrema and inflection points on the grid x_vals from the kernels
+    returned by compile_critical_point_kernels.
+    f, f' and f'' are sampled once, sign changes are detected with vectorized NumPy, all
+    candidates are refined in a single batched bisection, and poles/discontinuities are discarded.
+    """
+    results = {'zeros': [], 'maxima': [], 'minima': [], 'inflections': []}
+    f_kernel, df_kernel, d2f_kernel = kernels
+    if f_kernel is None:
+        return results
+
+    # Bind the current parameter values so the root finders see a function of x alone
+    f = lambda t: f_kernel(t, *param_values)
+    df = lambda t: df_kernel(t, *param_values)
+    d2f = lambda t: d2f_kernel(t, *param_values)
+
+    y_vals = sample_function(f, x_vals)
+    tol = 1e-9 * (1 + np.abs(x_vals[-1] - x_vals[0]))
+
+    def snap(vals, limit):
+        # Report round-off sized x-values as exactly zero
+        return np.where(np.abs(vals) <= limit, 0.0, vals)
+
+    # Zeros of f
+    zeros, _ = solve_sampled(f, x_vals, y_vals)
+
+    # Local extrema: f' changes sign and f is defined there
+    if df_kernel is not None:
+        crit, crit_dir = solve_sampled(df, x_vals, sample_function(df, x_vals))
+        crit_y = sample_function(f, crit)
+        valid = np.isfinite(crit_y)
+        crit, crit_dir, crit_y = snap(crit[valid], tol), crit_dir[valid], crit_y[valid]
+        results['maxima'] = list(zip(crit[crit_dir < 0], crit_y[crit_dir < 0]))
+        results['minima'] = list(zip(crit[crit_dir > 0], crit_y[crit_dir > 0]))
+
+        # Extrema where f vanishes up to round-off are zeros without a sign change.
+        # The round-off is judged against f on the neighbouring grid points, not the whole range.
+        neighbour = np.clip(np.searchsorted(x_vals, crit), 1, x_vals.size - 1)
+        local_scale = np.fmax(np.abs(y_vals[neighbour - 1]), np.abs(y_vals[neighbour]))
+        local_scale = np.fmax(np.nan_to_num(local_scale, nan=1.0, posinf=1.0), 1.0)
+        touching = crit[np.abs(crit_y) <= 1e4 * np.spacing(local_scale)]
+        zeros, _ = merge_close_points(
+            np.concatenate((zeros, touching)), np.zeros(zeros.size + touching.size), tol
+        )
+
+    # Inflection points: f'' changes sign and f is defined there
+    if d2f_kernel is not None:
+        infl, _ = solve_sampled(d2f, x_vals, sample_function(d2f, x_vals))
+        infl_y = sample_function(f, infl)
+        valid = np.isfinite(infl_y)
+        results['inflections'] = list(zip(snap(infl[valid], tol), infl_y[valid]))
+
+    results['zeros'] = list(snap(zeros, tol))
+    return results
+
+def format_points(points):
+    """
+    Format a list of x-values or (x, y) pairs for the results panel.
+    """
+    if not points:
+        return "none"
+    formatted = []
+    for point in points:
+        if isinstance(point, tuple):
+            formatted.append(f"({point[0]:.4g}, {point[1]:.4g})")
+        else:
+            formatted.append(f"{point:.4g}")
+    return ", ".join(formatted)
+
+def symbolic_breakpoints(func_expr, x_sym, a, b):
+    """
+    Collect the x-values inside (a, b) where a piecewise condition switches or the argument of
+    Abs, sign or Heaviside changes sign, i.e. where the function may have a jump or kink.
+    Equations that cannot be solved are skipped; adaptive splitting still finds those points.
+    """
+    equations = [relation.lhs - relation.rhs for relation in func_expr.atoms(sp.core.relational.Relational)]
+    equations += [atom.args[0] for atom in func_expr.atoms(sp.Abs, sp.sign, sp.Heaviside)]
+    points = set()
+    for equation in equations:
+        try:
+            solutions = sp.solveset(equation, x_sym, domain=sp.Interval(a, b))
+        except Exception:
+            continue
+        if isinstance(solutions, sp.FiniteSet):
+            points.update(float(point) for point in solutions if a < point < b)
+    return sorted(points)
+
+def symbolic_singularities(func_expr, x_sym, a, b):
+    """
+    Collect the x-values in [a, b] where SymPy finds the function singular (poles, but also
+    removable or integrable points such as sin(x)/x or log(x) at 0).
+    Returns an empty list if SymPy cannot determine them.
+    """
+    try:
+        solutions = sp.singularities(func_expr, x_sym, sp.Interval(a, b))
+    except Exception:
+        return []
+    if not isinstance(solutions, sp.FiniteSet):
+        return []
+    points = set()
+    for point in solutions:
+        if point.is_real and a <= point <= b:
+            points.add(float(point))
+    return sorted(points)
+
+def is_pole(func, point, h):
+    """
+    Decide whether func blows up at point like a pole, by checking that |func| grows at least
+    8-fold each time the distance to point shrinks 16-fold (h, 16h, 256h) on either side.
+    Bounded or integrable singularities such as log(x) or 1/sqrt(x) grow more slowly.
+    """
+    distances = h * 16.0 ** np.arange(3)
+    for side in (-1, 1):
+        values = np.abs(sample_function(func, point + side * distances))
+        if np.all(np.isfinite(values)) and np.all(values[:-1] >= 8 * values[1:]):
+            return True
+    return False
+
+def fit_chebyshev_piece(func, a, b, tol=1e-12, max_degree=128):
+    """
+    Interpolate func on [a, b] with Chebyshev series of doubling degree until the trailing
+    coefficients fall below tol relative to the largest one.
+    Returns the chopped series, or None if the piece does not converge or is not finite.
+    """
+    degree = 16
+    while degree <= max_degree:
+        with np.errstate(all='ignore'):
+            series = np.polynomial.Chebyshev.interpolate(
+                lambda t: sample_function(func, t), degree, domain=[a, b]
+            )
+        coeffs = series.coef
+        if not np.all(np.isfinite(coeffs)):
+            return None
+        scale = np.max(np.abs(coeffs))
+        if scale == 0 or np.max(np.abs(coeffs[-3:])) <= tol * scale:
+            # Chop the coefficients that are below the tolerance
+            significant = np.nonzero(np.abs(coeffs) > tol * scale)[0]
+            length = significant[-1] + 1 if significant.size else 1
+            return np.polynomial.Chebyshev(coeffs[:length], domain=[a, b])
+        degree *= 2
+    return None
+
+def fit_chebyshev_proxy(func, a, b, breakpoints=(), singularities=(), tol=1e-12, max_degree=128,
+                        max_pieces=500, time_budget=1.0):
+    """
+    Fit func on [a, b] once with a piecewise adaptive Chebyshev expansion.
+    The interval is first split at the given breakpoints and singularities; a tiny gap is cut
+    around each singularity that is a pole, with pieces graded geometrically towards it. Any
+    piece that does not converge is bisected again. Whatever is not fitted is recorded as a gap:
+    'undefined' where func has no finite values, 'pole' where it blows up, and 'unresolved' where
+    it is finite but did not converge (jumps, integrable endpoint singularities, or the
+    max_pieces or time_budget (seconds) running out). Adjacent gaps of the same kind are merged.
+    Gaps are answered by func itself. Returns a dict with the sorted 'pieces' and 'gaps', the
+    'domain', the estimated relative 'error' of the pieces and the 'uncovered' fraction of [a, b].
+    """
+    deadline = time.perf_counter() + time_budget
+    min_width = 1e-8 * (b - a)
+    pole_width = 1e-6 * (b - a)
+    points = {point for point in breakpoints if a < point < b}
+    pieces = []
+    gaps = []
+    for point in singularities:
+        if not is_pole(func, point, pole_width):
+            points.add(point)
+            continue
+        # Cut the pole out and grade the pieces around it so each one converges at low degree
+        gaps.append((max(point - pole_width, a), min(point + pole_width, b), 'pole'))
+        distance = pole_width
+        while distance < b - a:
+            points.update(point + side * distance for side in (-1, 1))
+            distance *= 4
+    edges = [a] + sorted(point for point in points if a < point < b) + [b]
+    pending = [
+        (lo, hi) for lo, hi in zip(edges[:-1], edges[1:])
+        if not any(gap_lo <= lo and hi <= gap_hi for gap_lo, gap_hi, _ in gaps)
+    ][::-1]
+
+    coarse = sample_function(func, np.linspace(a, b, 201))
+    coarse = coarse[np.isfinite(coarse)]
+    scale = np.max(np.abs(coarse)) if coarse.size else 0.0
+
+    while pending:
+        lo, hi = pending.pop()
+        if time.perf_counter() > deadline:
+            gaps.append((lo, hi, 'unresolved'))
+            continue
+        series = fit_chebyshev_piece(func, lo, hi, tol, max_degree)
+        if series is not None:
+            pieces.append(series)
+            continue
+        # Undefined regions are left out instead of being split forever
+        probe = sample_function(func, np.linspace(lo, hi, 17)[1:-1])
+        if not np.any(np.isfinite(probe)):
+            gaps.append((lo, hi, 'undefined'))
+            continue
+        if hi - lo <= min_width:
+            # A continuous kink is bridged linearly; poles and jumps are left as gaps
+            ends = sample_function(func, np.array([lo, hi]))
+            if np.all(np.isfinite(ends)) and abs(ends[1] - ends[0]) <= 1e-6 * (1 + scale):
+                coeffs = [0.5 * (ends[0] + ends[1]), 0.5 * (ends[1] - ends[0])]
+                pieces.append(np.polynomial.Chebyshev(coeffs, domain=[lo, hi]))
+            elif np.all(np.isfinite(probe)) and np.max(np.abs(probe)) <= 1e3 * (1 + scale):
+                gaps.append((lo, hi, 'unresolved'))
+            else:
+                gaps.append((lo, hi, 'pole'))
+            continue
+        if len(pieces) + len(pending) >= max_pieces:
+            gaps.append((lo, hi, 'unresolved'))
+            continue
+        mid = 0.5 * (lo + hi)
+        pending.extend([(mid, hi), (lo, mid)])
+
+    # Merge touching gaps of the same kind, e.g. the run of bisected slivers beside a jump
+    merged = []
+    for lo, hi, kind in sorted(gaps):
+        if merged and merged[-1][2] == kind and lo <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(hi, merged[-1][1]), kind)
+        else:
+            merged.append((lo, hi, kind))
+    gaps = merged
+
+    # Estimate the fitting error away from the interpolation nodes, including the piece edges
+    # the proxy answers itself (a shared edge belongs to the piece on its right; a and b are
+    # answered by func)
+    error = 0.0
+    starts = {series.domain[0] for series in pieces}
+    for series in pieces:
+        lo, hi = series.domain
+        test_x = np.linspace(lo, hi, 2 * len(series.coef) + 3)
+        answered = (test_x > a) & (test_x < b)
+        if hi in starts:
+            answered[-1] = False
+        test_x = test_x[answered]
+        exact = sample_function(func, test_x)
+        finite = np.isfinite(exact)
+        if np.any(finite):
+            piece_scale = max(np.max(np.abs(exact[finite])), 1.0)
+            piece_error = np.max(np.abs(series(test_x[finite]) - exact[finite])) / piece_scale
+            error = max(error, piece_error)
+
+    proxy = {
+        'func': func,
+        'pieces': pieces,
+        'gaps': gaps,
+        'domain': (a, b),
+        'error': error,
+        'uncovered': sum(hi - lo for lo, hi, _ in gaps) / (b - a),
+        'lo': np.array([series.domain[0] for series in pieces]),
+        'hi': np.array([series.domain[1] for series in pieces]),
+        'derivatives': {},
+    }
+
+    # Precompute every table sampling needs so evaluation is a lookup plus one Clenshaw pass
+    for order in range(3):
+        proxy_coefficient_table(proxy, order)
+    antiderivatives = [series.integ(lbnd=series.domain[0]) for series in pieces]
+    proxy['antiderivative'] = chebyshev_coefficient_table(antiderivatives)
+
+    # Walk pieces and gaps in order: the antiderivative stays continuous across pieces and
+    # unresolved gaps (integrated with quad) and restarts from zero after poles and undefined gaps
+    segments = sorted(
+        [(series.domain[0], series.domain[1], 'piece', row) for row, series in enumerate(pieces)]
+        + [(lo, hi, kind, row) for row, (lo, hi, kind) in enumerate(gaps)]
+    )
+    offsets = np.zeros(len(pieces))
+    gap_offsets = np.full(len(gaps), np.nan)
+    offset = 0.0
+    for lo, hi, kind, row in segments:
+        if kind == 'piece':
+            offsets[row] = offset
+            offset += antiderivatives[row](hi)
+        elif kind == 'unresolved':
+            gap_offsets[row] = offset
+            offset += gap_integral(func, lo, hi)
+            if not np.isfinite(offset):
+                offset = 0.0
+        else:
+            offset = 0.0
+    proxy['offsets'] = offsets
+    proxy['gap_offsets'] = gap_offsets
+    return proxy
+
+def gap_integral(func, a, b):
+    """
+    Integrate func from a to b with quad, for stretches the proxy could not fit.
+    Isolated undefined points carry no area; returns NaN if quad fails.
+    """
+    try:
+        return numerical_integral(
+            lambda t: float(np.nan_to_num(sample_function(func, t), nan=0.0)), a, b
+        )
+    except ValueError:
+        return np.nan
+
+def chebyshev_coefficient_table(series_list):
+    """
+    Stack the coefficients of a list of Chebyshev series into a zero-padded matrix.
+    Returns (matrix, lengths) with one row per series.
+    """
+    lengths = np.array([len(series.coef) for series in series_list], dtype=int)
+    matrix = np.zeros((len(series_list), lengths.max() if lengths.size else 1))
+    for row, series in enumerate(series_list):
+        matrix[row, :lengths[row]] = series.coef
+    return matrix, lengths
+
+def proxy_coefficient_table(proxy, order):
+    """
+    Return the coefficient table of the proxy's derivative of the given order.
+    Orders 0-2 are built by fit_chebyshev_proxy; higher orders are built once on first use.
+    """
+    if order not in proxy['derivatives']:
+        series_list = [series.deriv(order) if order else series for series in proxy['pieces']]
+        proxy['derivatives'][order] = chebyshev_coefficient_table(series_list)
+    return proxy['derivatives'][order]
+
+def locate_proxy_pieces(proxy, x_vals):
+    """
+    Map each x-value to the index of the proxy piece containing it, or -1 if none does.
+    """
+    piece = np.full(x_vals.shape, -1)
+    if proxy['lo'].size == 0:
+        return piece
+    candidate = np.searchsorted(proxy['lo'], x_vals, side='right') - 1
+    inside = (candidate >= 0) & np.isfinite(x_vals)
+    inside &= x_vals <= proxy['hi'][np.maximum(candidate, 0)]
+    piece[inside] = candidate[inside]
+    return piece
+
+def evaluate_coefficient_table(proxy, table, x_vals):
+    """
+    Evaluate a per-piece coefficient table at x_vals with a vectorized Clenshaw recurrence.
+    Returns the values (NaN outside the pieces) and the piece index of every point.
+    """
+    x_vals = np.asarray(x_vals, dtype=float)
+    flat_x = x_vals.ravel()
+    y_vals = np.full(flat_x.shape, np.nan)
+    piece = locate_proxy_pieces(proxy, flat_x)
+    inside = piece >= 0
+    if np.any(inside):
+        matrix, lengths = table
+        index = piece[inside]
+        lo, hi = proxy['lo'][index], proxy['hi'][index]
+        t = (2 * flat_x[inside] - (lo + hi)) / (hi - lo)
+        # One contiguous row per coefficient keeps each recurrence step a few fused array ops
+        coeffs = np.ascontiguousarray(matrix[index, :lengths[index].max()].T)
+        two_t = 2 * t
+        b1 = np.zeros_like(t)
+        b2 = np.zeros_like(t)
+        for k in range(coeffs.shape[0] - 1, 0, -1):
+            b2 = coeffs[k] + two_t * b1 - b2
+            b1, b2 = b2, b1
+        y_vals[inside] = coeffs[0] + t * b1 - b2
+    return y_vals.reshape(x_vals.shape), piece.reshape(x_vals.shape)
+
+def evaluate_proxy(proxy, x_vals, order=0):
+    """
+    Evaluate a Chebyshev proxy, or its derivative of the given order, at x_vals.
+    Points outside the fitted pieces fall back to the original function, with finite
+    differences for derivatives up to order 3 (NaN beyond that). Values at the ends of the fitted
+    domain also come from the function, since a jump there is invisible to the fit.
+    """
+    y_vals, piece = evaluate_coefficient_table(proxy, proxy_coefficient_table(proxy, order), x_vals)
+    outside = piece < 0
+    if order == 0:
+        outside |= np.isin(x_vals, proxy['domain'])
+    if np.any(outside):
+        func = lambda t: sample_function(proxy['func'], t)
+        x_outside = np.asarray(x_vals, dtype=float)[outside]
+        if order == 0:
+            y_vals[outside] = func(x_outside)
+        elif order <= 3:
+            with np.errstate(all='ignore'):
+                y_vals[outside] = numerical_derivative(func, x_outside, order)
+    return y_vals
+
+def proxy_cumulative_integral(proxy, x_vals):
+    """
+    Evaluate an antiderivative of a Chebyshev proxy at x_vals.
+    The antiderivative is continuous across pieces and unresolved gaps (integrated with quad)
+    and restarts from zero after each pole or undefined gap, where it is NaN.
+    """
+    x_vals = np.asarray(x_vals, dtype=float)
+    y_vals, piece = evaluate_coefficient_table(proxy, proxy['antiderivative'], x_vals)
+    inside = piece >= 0
+    y_vals[inside] += proxy['offsets'][piece[inside]]
+
+    for (lo, hi, kind), offset in zip(proxy['gaps'], proxy['gap_offsets']):
+        if kind != 'unresolved':
+            continue
+        in_gap = ~inside & (x_vals >= lo) & (x_vals <= hi)
+        if not np.any(in_gap):
+            continue
+        # Integrate between consecutive points so each quad call covers a short stretch
+        positions = np.nonzero(in_gap.ravel())[0]
+        gap_x = x_vals.ravel()[positions]
+        order = np.argsort(gap_x)
+        steps = np.diff(np.concatenate(([lo], gap_x[order])))
+        starts = np.concatenate(([lo], gap_x[order][:-1]))
+        partial = [gap_integral(proxy['func'], start, start + step) for start, step in zip(starts, steps)]
+        flat = y_vals.reshape(-1)
+        flat[positions[order]] = offset + np.cumsum(partial)
+    return y_vals
+
+def proxy_definite_integral(proxy, a, b):
+    """
+    Compute the definite integral of a Chebyshev proxy from a to b.
+    Unresolved gaps are integrated with quad; returns NaN when [a, b] crosses a pole or an
+    undefined gap, or leaves the fitted domain, since the integral there is not defined.
+    """
+    if a > b:
+        return -proxy_definite_integral(proxy, b, a)
+    segments = sorted(
+        [(series.domain[0], series.domain[1], series) for series in proxy['pieces']]
+        + [(lo, hi, kind) for lo, hi, kind in proxy['gaps']],
+        key=lambda segment: segment[0]
+    )
+    total = 0.0
+    covered = a
+    for seg_lo, seg_hi, content in segments:
+        lo, hi = max(seg_lo, a), min(seg_hi, b)
+        if lo >= hi:
+            continue
+        if lo > covered:
+            return np.nan
+        if isinstance(content, str):
+            if content != 'unresolved':
+                return np.nan
+            total += gap_integral(proxy['func'], lo, hi)
+        else:
+            total += content.integ(lbnd=lo)(hi)
+        covered = hi
+    return total if covered >= b else np.nan
+
+def proxy_kernels(proxy):
+    """
+    Return evaluators for a Chebyshev proxy and its first two derivatives, in the same
+    (f, f', f'') layout as compile_critical_point_kernels.
+    """
+    return tuple((lambda t, order=order: evaluate_proxy(proxy, t, order)) for order in range(3))
+
+def add_proxy_resampling(ax, proxy, curves, samples=400):
+    """
+    Re-sample the proxy-backed lines whenever the x-limits change (zoom or pan), so zoomed
+    views stay smooth without going back through SymPy or lambdify.
+    """
+    def on_xlim_changed(axes):
+        lo, hi = axes.get_xlim()
+        lo, hi = max(lo, proxy['domain'][0]), min(hi, proxy['domain'][1])
+        if lo >= hi:
+            return
+        x_vals = np.linspace(lo, hi, samples)
+        for artist, kernel in curves:
+            # Filled areas (e.g. the definite integral) keep their original shape
+            if isinstance(artist, Line2D):
+                artist.set_data(x_vals, sample_function(kernel, x_vals))
+
+    ax.callbacks.connect('xlim_changed', on_xlim_changed)
+
+def describe_proxy(proxy):
+    """
+    Summarize a Chebyshev proxy for the results panel.
+    """
+    degree = max((len(series.coef) - 1 for series in proxy['pieces']), default=0)
+    text = (f"Chebyshev Proxy: {len(proxy['pieces'])} pieces, degree <= {degree}, "
+            f"est. rel. error {proxy['error']:.2e}")
+    if proxy['gaps']:
+        text += f", {100 * proxy['uncovered']:.2g}% of range not fitted (evaluated directly)"
+    return text
+
+def safe_critical_points(kernels, x_vals, param_values=()):
+    """
+    Run find_critical_points, returning empty results instead of raising so a failed
+    analysis never costs the user the graph itself.
+    """
+    try:
+        return find_critical_points(kernels, x_vals, param_values)
+    except Exception as e:
+        print(f"Critical-point analysis failed: {e}")
+        return {'zeros': [], 'maxima': [], 'minima': [], 'inflections': []}
+
+def describe_critical_points(critical_points):
+    """
+    Build the results-panel lines for zeros, extrema and inflection points.
+    """
+    titles = [("Zeros", 'zeros'), ("Local Maxima", 'maxima'),
+              ("Local Minima", 'minima'), ("Inflection Points", 'inflections')]
+    return [f"{title}: {format_points(critical_points[key])}" for title, key in titles]
+
 def save_graph():
     global current_figure
     if current_figure is None:
@@ -149,6 +779,7 @@ def show_help():
     1. FUNCTION INPUT:
        - Enter a mathematical function in the "Function f(x)" field.
        - Example: sin(x) + x**2 - 3 or {x < 0: x**2, x >= 0: x + 1} for piecewise functions.
+       - Letters other than x become parameters with their own sliders, e.g. a*sin(b*x) + c.
 
     2. X-RANGE:
        - Set the minimum and maximum x-values in the "X Range" fields.
@@ -171,12 +802,18 @@ def show_help():
        - Upload a file containing functions (supported formats: .txt, .pdf, .docx).
        - Each line in the file should contain a valid function.
 
-    6. CONTROLS:
+    6. ANALYSIS:
+       - Each graph lists the zeros, local maxima/minima and inflection points found in the X Range.
+       - Poles and jump discontinuities are filtered out automatically.
+       - Turn on "Chebyshev proxy" to fit each function once and sample the graph, derivative,
+         integrals and zoomed views from that fit; the results show its estimated error.
+
+    7. CONTROLS:
        - Generate Visualization: Click this button to plot the graph based on your inputs.
        - Save Graph: Save the generated graph as an image (PNG, JPEG, PDF, etc.).
        - Reset: Clear all inputs and reset the application to its default state.
 
-    7. THEMES:
+    8. THEMES:
        - Use the 🌙/☀️ button in the top-right corner to toggle between light and dark modes.
 
     NOTES:
@@ -328,6 +965,142 @@ def upload_file():
     except Exception as e:
         result_label.config(text=f"Error: {str(e)}", foreground="#f44336")
 
+def compile_parameter_integral(definite_integral, params, func_kernel, a, b):
+    """
+    Compile a definite integral whose closed form depends on the parameters.
+    SciPy is tried before NumPy so special functions such as Si are available; if the closed
+    form still cannot be compiled or evaluated, the value is computed with quad over func_kernel.
+    """
+    try:
+        closed_form = sp.lambdify(params, definite_integral, ['scipy', 'numpy'])
+    except Exception:
+        closed_form = None
+
+    def evaluate(values):
+        if closed_form is not None:
+            try:
+                value = float(np.real(closed_form(*values)))
+                if np.isfinite(value):
+                    return value
+            except Exception:
+                pass
+        # Isolated undefined points such as sin(x)/x at 0 carry no area
+        try:
+            return numerical_integral(
+                lambda t: float(np.nan_to_num(sample_function(func_kernel, t, *values), nan=0.0)), a, b
+            )
+        except ValueError:
+            return np.nan
+
+    return evaluate
+
+def add_parameter_sliders(parent, canvas, ax, params, x_vals, curves, label_updates, before=None):
+    """
+    Add one slider per parameter below the graph.
+    curves holds [artist, kernel] pairs whose kernels were lambdified once with (x, *params);
+    moving a slider only re-evaluates them on x_vals and blits the animated artists, without
+    re-parsing or redrawing the whole figure. label_updates holds (labels, text_func) pairs
+    whose text_func(values) returns the new text for each label.
+    """
+    slider_frame = tb.LabelFrame(parent, text="Parameters", padding=10)
+    slider_frame.pack(fill=X, padx=10, pady=(5, 0), before=before)
+
+    slider_vars = []
+    value_labels = []
+    state = {'background': None, 'pending': False}
+
+    def redraw_animated():
+        for artist, _ in curves:
+            ax.draw_artist(artist)
+        if ax.get_legend():
+            ax.draw_artist(ax.get_legend())
+
+    def on_draw(event):
+        # Full redraws (resize, zoom, theme) invalidate the cached background
+        state['background'] = canvas.copy_from_bbox(ax.bbox)
+        redraw_animated()
+
+    def render():
+        state['pending'] = False
+        values = [var.get() for var in slider_vars]
+        for value_label, value in zip(value_labels, values):
+            value_label.config(text=f"{value:.2f}")
+
+        data_min, data_max = np.inf, -np.inf
+        for curve in curves:
+            artist, kernel = curve
+            y_vals = sample_function(kernel, x_vals, *values)
+            finite = y_vals[np.isfinite(y_vals)]
+            if finite.size:
+                data_min, data_max = min(data_min, finite.min()), max(data_max, finite.max())
+            if hasattr(artist, 'set_ydata'):
+                artist.set_ydata(y_vals)
+            elif hasattr(artist, 'set_data'):
+                # matplotlib >= 3.10 can reshape a fill_between area in place
+                artist.set_data(x_vals, y_vals, 0, where=np.isfinite(y_vals))
+                data_min, data_max = min(data_min, 0.0), max(data_max, 0.0)
+            else:
+                # Older filled areas cannot be reshaped, so swap in a new collection while
+                # keeping the autoscale it requests from moving the current view
+                ylim, auto = ax.get_ylim(), ax.get_autoscaley_on()
+                artist.remove()
+                curve[0] = ax.fill_between(
+                    x_vals, y_vals, where=np.isfinite(y_vals),
+                    color=artist.get_facecolor()[0], animated=True
+                )
+                ax.set_ylim(ylim)
+                ax.set_autoscaley_on(auto)
+                data_min, data_max = min(data_min, 0.0), max(data_max, 0.0)
+
+        for labels, text_func in label_updates:
+            # A failing label must not keep the curves from being redrawn
+            try:
+                for label, text in zip(labels, text_func(values)):
+                    label.config(text=text)
+            except Exception as e:
+                print(f"Could not update results: {e}")
+
+        y_min, y_max = ax.get_ylim()
+        if state['background'] is None or data_min < y_min or data_max > y_max:
+            # The curves left the view: rescale once with a full redraw, which also
+            # re-captures the background; later moves inside the new view blit again
+            ax.relim()
+            ax.set_autoscaley_on(True)
+            ax.autoscale_view(scalex=False)
+            if canvas.toolbar is not None:
+                canvas.toolbar.update()  # Home now returns to the rescaled view
+            canvas.draw_idle()
+            return
+        canvas.restore_region(state['background'])
+        redraw_animated()
+        canvas.blit(ax.bbox)
+
+    def on_slide(_value):
+        # Coalesce bursts of slider events into one redraw per idle cycle
+        if not state['pending']:
+            state['pending'] = True
+            slider_frame.after_idle(render)
+
+    for row, param in enumerate(params):
+        var = tb.DoubleVar(value=parameter_default)
+        slider_vars.append(var)
+        tb.Label(slider_frame, text=f"{param.name}:").grid(row=row, column=0, padx=5, sticky=W)
+        tb.Scale(
+            slider_frame,
+            from_=parameter_range[0],
+            to=parameter_range[1],
+            variable=var,
+            command=on_slide,
+            bootstyle="info"
+        ).grid(row=row, column=1, padx=5, sticky=EW)
+        value_label = tb.Label(slider_frame, text=f"{parameter_default:.2f}", width=6)
+        value_label.grid(row=row, column=2, padx=5, sticky=E)
+        value_labels.append(value_label)
+    slider_frame.columnconfigure(1, weight=1)
+
+    canvas.mpl_connect('draw_event', on_draw)
+    canvas.draw_idle()
+
 def plot_graph():
     global current_figure, current_canvas
 
@@ -352,20 +1125,45 @@ def plot_graph():
         # Determine functions to plot
         functions_to_plot = [func_input.get()] if func_input.get() else uploaded_functions
 
+        # Shared dense grid for critical-point analysis of every function in this pass
+        analysis_x_vals = np.linspace(x_min_val, x_max_val, 2001)
+
         # Plot each function in a new tab
         for func_str in functions_to_plot:
             try:
-                # Parse the function
-                func_expr, x = parse_function(func_str)
-                func_lambdified = sp.lambdify(x, func_expr, 'numpy')
+                # Parse the function and compile it once with any parameters as extra arguments
+                func_expr, x, params = parse_function(func_str)
+                kernel_args = (x, *params)
+                param_values = [parameter_default] * len(params)
+                func_lambdified = sp.lambdify(kernel_args, func_expr, 'numpy')
+
+                # Optionally fit a Chebyshev proxy once and sample everything from its coefficients
+                proxy = None
+                if use_proxy_var.get() and not params:
+                    breakpoints = symbolic_breakpoints(func_expr, x, x_min_val, x_max_val)
+                    singularities = symbolic_singularities(func_expr, x, x_min_val, x_max_val)
+                    proxy = fit_chebyshev_proxy(func_lambdified, x_min_val, x_max_val, breakpoints,
+                                                singularities)
+                    func_lambdified = proxy_kernels(proxy)[0]
 
                 # Generate x and y values
                 x_vals = np.linspace(x_min_val, x_max_val, 400)
-                y_vals = func_lambdified(x_vals)
+                y_vals = sample_function(func_lambdified, x_vals, *param_values)
 
                 # Compute derivative and integral
                 derivative = sp.diff(func_expr, x)
-                indefinite_integral = sp.integrate(func_expr, x)
+                indefinite_integral = sp.integrate(func_expr, x) if proxy is None else None
+
+                # Find zeros, extrema and inflection points
+                if proxy is None:
+                    critical_kernels = compile_critical_point_kernels(func_expr, x, params)
+                else:
+                    critical_kernels = proxy_kernels(proxy)
+                critical_points = safe_critical_points(critical_kernels, analysis_x_vals, param_values)
+
+                # Parameterized curves are blitted when a slider moves
+                animated = bool(params)
+                curves = []
 
                 # Create new tab
                 tab = tb.Frame(notebook)
@@ -378,32 +1176,49 @@ def plot_graph():
 
                 # Plot based on selected options
                 if plot_option.get() in ["Function", "Both"]:
-                    ax.plot(x_vals, y_vals, label='Function', color='blue')
+                    line, = ax.plot(x_vals, y_vals, label='Function', color='blue', animated=animated)
+                    curves.append([line, func_lambdified])
 
                 if plot_option.get() in ["Derivative", "Both"]:
-                    derivative_lambdified = sp.lambdify(x, derivative, 'numpy')
-                    ax.plot(x_vals, derivative_lambdified(x_vals), label='Derivative', color='green')
+                    if proxy is None:
+                        derivative_lambdified = sp.lambdify(kernel_args, derivative, 'numpy')
+                    else:
+                        derivative_lambdified = proxy_kernels(proxy)[1]
+                    derivative_vals = sample_function(derivative_lambdified, x_vals, *param_values)
+                    line, = ax.plot(x_vals, derivative_vals, label='Derivative', color='green', animated=animated)
+                    curves.append([line, derivative_lambdified])
 
                 if plot_option.get() in ["Integral", "Both"]:
-                    # Symbolic indefinite integral
-                    integral_lambdified = sp.lambdify(x, indefinite_integral, 'numpy')
-                    integral_vals = integral_lambdified(x_vals)
-                    ax.plot(x_vals, integral_vals, label='Indefinite Integral', color='purple')
+                    # Indefinite integral, symbolic or sampled from the proxy
+                    if proxy is None:
+                        # SciPy first so special functions such as Si(a*x) can be sampled
+                        integral_lambdified = sp.lambdify(kernel_args, indefinite_integral, ['scipy', 'numpy'])
+                    else:
+                        integral_lambdified = lambda t, proxy=proxy: proxy_cumulative_integral(proxy, t)
+                    integral_vals = sample_function(integral_lambdified, x_vals, *param_values)
+                    line, = ax.plot(x_vals, integral_vals, label='Indefinite Integral', color='purple', animated=animated)
+                    curves.append([line, integral_lambdified])
 
                 if plot_option.get() in ["Definite Integral", "Both"]:
                     # Numerical definite integral
                     lower_bound = float(x_min.get())
                     upper_bound = float(x_max.get())
-                    definite_integral = sp.integrate(func_expr, (x, lower_bound, upper_bound))
+                    if proxy is None:
+                        definite_integral = sp.integrate(func_expr, (x, lower_bound, upper_bound))
+                    else:
+                        definite_integral = proxy_definite_integral(proxy, lower_bound, upper_bound)
 
                     # Shade the area under the curve
-                    ax.fill_between(
+                    fill = ax.fill_between(
                         x_vals, y_vals, where=(x_vals >= lower_bound) & (x_vals <= upper_bound),
-                        color='orange', alpha=0.3, label=f"Def. Integral [{lower_bound}, {upper_bound}]"
+                        color='orange', alpha=0.3, label=f"Def. Integral [{lower_bound}, {upper_bound}]",
+                        animated=animated
                     )
+                    curves.append([fill, func_lambdified])
 
                 if plot_option.get() in ["Piecewise", "Both"]:
-                    ax.plot(x_vals, y_vals, label='Piecewise Function', color='red')
+                    line, = ax.plot(x_vals, y_vals, label='Piecewise Function', color='red', animated=animated)
+                    curves.append([line, func_lambdified])
 
                 # Finalize the graph
                 ax.legend(loc='upper right', framealpha=0.5)
@@ -443,6 +1258,7 @@ def plot_graph():
 
                 # Add function details with uniform font color
                 text_color = get_text_color()
+                label_updates = []
 
                 func_label = tb.Label(
                     equations_frame,
@@ -462,23 +1278,41 @@ def plot_graph():
                     derivative_label.pack(anchor=W)
 
                 if plot_option.get() in ["Integral", "Both"]:
+                    if proxy is None:
+                        integral_text = sp.pretty(indefinite_integral, use_unicode=True)
+                    else:
+                        integral_text = "sampled from Chebyshev proxy"
                     integral_label = tb.Label(
                         equations_frame,
-                        text=f"Indefinite Integral: {sp.pretty(indefinite_integral, use_unicode=True)}",
+                        text=f"Indefinite Integral: {integral_text}",
                         font=('Courier New', 10),
                         foreground=text_color
                     )
                     integral_label.pack(anchor=W)
 
                 if plot_option.get() in ["Definite Integral", "Both"]:
+                    definite_text = f"Definite Integral [{lower_bound}, {upper_bound}]: {definite_integral}"
+                    if params:
+                        definite_lambdified = compile_parameter_integral(
+                            definite_integral, params, func_lambdified, lower_bound, upper_bound
+                        )
+                        definite_text_func = (
+                            lambda values, evaluate=definite_lambdified, lo=lower_bound, hi=upper_bound:
+                                [f"Definite Integral [{lo}, {hi}]: {evaluate(values):.6g}"]
+                        )
+                        definite_text = definite_text_func(param_values)[0]
+
                     definite_label = tb.Label(
                         equations_frame,
-                        text=f"Definite Integral [{lower_bound}, {upper_bound}]: {definite_integral}",
+                        text=definite_text,
                         font=('Courier New', 10),
                         foreground=text_color
                     )
                     definite_label.pack(anchor=W)
 
+                    if params:
+                        label_updates.append(([definite_label], definite_text_func))
+
                 if plot_option.get() in ["Piecewise", "Both"]:
                     piecewise_label = tb.Label(
                         equations_frame,
@@ -488,6 +1322,37 @@ def plot_graph():
                     )
                     piecewise_label.pack(anchor=W)
 
+                if proxy is not None:
+                    proxy_label = tb.Label(
+                        equations_frame,
+                        text=describe_proxy(proxy),
+                        font=('Courier New', 10),
+                        foreground=text_color
+                    )
+                    proxy_label.pack(anchor=W)
+                    add_proxy_resampling(ax, proxy, curves)
+
+                points_labels = []
+                for text in describe_critical_points(critical_points):
+                    points_label = tb.Label(
+                        equations_frame,
+                        text=text,
+                        font=('Courier New', 10),
+                        foreground=text_color
+                    )
+                    points_label.pack(anchor=W)
+                    points_labels.append(points_label)
+
+                if params:
+                    label_updates.append((
+                        points_labels,
+                        lambda values, kernels=critical_kernels:
+                            describe_critical_points(safe_critical_points(kernels, analysis_x_vals, values))
+                    ))
+                    add_parameter_sliders(
+                        tab, canvas, ax, params, x_vals, curves, label_updates, before=results_container
+                    )
+
             except Exception as e:
                 print(f"Skipping invalid function '{func_str}': {e}")
                 continue
@@ -508,6 +1373,7 @@ def reset_app():
     x_max.set("")
     plot_option.set("Function")
     derivative_order_var.set(1)
+    use_proxy_var.set(False)
 
     # Clear the notebook tabs
     for tab in notebook.winfo_children():
@@ -643,6 +1509,12 @@ plot_combo = tb.Combobox(plot_frame, textvariable=plot_option,
                                 "Piecewise", "Both"], width=12)
 plot_combo.pack(side=LEFT, padx=5)
 
+# Proxy option
+use_proxy_var = tb.BooleanVar(value=False)
+proxy_check = tb.Checkbutton(options_frame, text="Chebyshev proxy (fast evaluation)",
+                             variable=use_proxy_var, bootstyle="round-toggle")
+proxy_check.pack(fill=X, padx=5, pady=5)
+
 # Button and results
 button_frame = tb.Frame(control_frame)
 button_frame.pack(fill=X, pady=10)